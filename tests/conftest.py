@@ -1,5 +1,14 @@
+import os
+import sys
+
 import pytest
 
+# Make sure the tests pick up the pycdlib in this source tree rather than any
+# installed copy.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pycdlib
+
 def pytest_addoption(parser):
     parser.addoption('--runslow', action='store_true',
                      default=False, help='run slow tests')
@@ -18,3 +27,38 @@ def pytest_runtest_teardown(item):
         tmpdir = item.funcargs['tmpdir']
         if tmpdir.check():
             tmpdir.remove()
+
+@pytest.fixture
+def iso_factory():
+    # Hands out new()'ed PyCdlib objects and makes sure they all get closed
+    # once the test is done, even if the test failed part way through.
+    isos = []
+
+    def make(always_consistent=False, **kwargs):
+        iso = pycdlib.PyCdlib(always_consistent=always_consistent)
+        iso.new(**kwargs)
+        isos.append(iso)
+        return iso
+
+    yield make
+
+    for iso in isos:
+        try:
+            iso.close()
+        except pycdlib.pycdlibexception.PyCdlibInvalidInput:
+            # The test already closed this object itself.
+            pass
+
+@pytest.fixture(scope='session')
+def very_large_file(tmpdir_factory):
+    # A sparse 5GB file for the slow tests that add it to an ISO.  They only
+    # ever read it, so one copy is shared rather than one per test.
+    indir = tmpdir_factory.mktemp('verylarge')
+    largefile = str(indir.join('bigfile'))
+
+    with open(largefile, 'w') as outfp:
+        outfp.truncate(5*1024*1024*1024)  # 5 GB
+
+    yield largefile
+
+    indir.remove()
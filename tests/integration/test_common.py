@@ -1,16 +1,11 @@
 # -*- coding: utf-8 -*-
 
-try:
-    from cStringIO import StringIO as BytesIO
-except ImportError:
-    from io import BytesIO
+from io import BytesIO
 import pytest
 import os
 import sys
 import struct
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 import pycdlib
 
 have_py_3 = True
@@ -23,6 +18,10 @@ if sys.version_info.major == 2:
 # support any names longer than 248.  Thus we stick to 248 for our tests.
 RR_MAX_FILENAME_LENGTH = 248
 
+# The signature that marks an ISO as XA; it lives at offset 141 of the
+# application use field of the volume descriptors.
+XA_SIGNATURE = b'CD-XA001'
+
 def find_executable(executable):
     paths = os.environ['PATH'].split(os.pathsep)
 
@@ -37,57 +36,86 @@ def find_executable(executable):
 
 ################################ INTERNAL HELPERS #############################
 
-def internal_check_pvd(pvd, extent, size, ptbl_size, ptbl_location_le, ptbl_location_be):
-    # The length of the system identifer should always be 32.
-    assert(len(pvd.system_identifier) == 32)
-    # The length of the volume identifer should always be 32.
-    assert(len(pvd.volume_identifier) == 32)
-    # The amount of space the ISO takes depends on the files and directories
-    # on the ISO.
-    assert(pvd.space_size == size)
-    # The set size should always be one for these tests.
-    assert(pvd.set_size == 1)
-    # genisoimage only supports setting the sequence number to 1
-    assert(pvd.seqnum == 1)
-    # genisoimage always produces ISOs with 2048-byte sized logical blocks.
-    assert(pvd.log_block_size == 2048)
-    # The path table size depends on how many directories there are on the ISO.
-    assert(pvd.path_tbl_size == ptbl_size)
-    # The little endian version of the path table should start at the location
-    # passed in (this changes based on how many volume descriptors there are,
-    # e.g. Joliet).
-    assert(pvd.path_table_location_le == ptbl_location_le)
-    # The optional path table location should always be zero.
-    assert(pvd.optional_path_table_location_le == 0)
-    # The big endian version of the path table changes depending on how many
-    # directories there are on the ISO.
-    assert(pvd.path_table_location_be == ptbl_location_be)
-    # The optional path table location should always be zero.
-    assert(pvd.optional_path_table_location_be == 0)
-    # The length of the volume set identifer should always be 128.
-    assert(len(pvd.volume_set_identifier) == 128)
-    # The volume set identifier is always blank here.
-    assert(pvd.volume_set_identifier == b' '*128)
-    # The publisher identifier text should be blank.
-    assert(pvd.publisher_identifier.text == b' '*128)
-    # The preparer identifier text should be blank.
-    assert(pvd.preparer_identifier.text == b' '*128)
-    # The copyright file identifier should be blank.
-    assert(pvd.copyright_file_identifier == b' '*37)
-    # The abstract file identifier should be blank.
-    assert(pvd.abstract_file_identifier == b' '*37)
-    # The bibliographic file identifier should be blank.
-    assert(pvd.bibliographic_file_identifier == b' '*37)
-    # The primary volume descriptor should always have a file structure version
-    # of 1.
-    assert(pvd.file_structure_version == 1)
-    # The length of the application use string should always be 512.
-    assert(len(pvd.application_use) == 512)
-    # The PVD should be where we want it.
-    assert(pvd.extent_location() == extent)
+def internal_check_pvd(pvd, extent, size, ptbl_size, ptbl_locations):
+    (ptbl_location_le, ptbl_location_be) = ptbl_locations
+
+    # All of the scalar fields of the PVD are gathered up and compared in one
+    # go; on a mismatch, the assertion shows every field that differs.
+    actual = (
+        # The length of the system identifer should always be 32.
+        len(pvd.system_identifier),
+        # The length of the volume identifer should always be 32.
+        len(pvd.volume_identifier),
+        # The amount of space the ISO takes depends on the files and
+        # directories on the ISO.
+        pvd.space_size,
+        # The set size should always be one for these tests.
+        pvd.set_size,
+        # genisoimage only supports setting the sequence number to 1
+        pvd.seqnum,
+        # genisoimage always produces ISOs with 2048-byte sized logical blocks.
+        pvd.log_block_size,
+        # The path table size depends on how many directories there are on
+        # the ISO.
+        pvd.path_tbl_size,
+        # The little endian version of the path table should start at the
+        # location passed in (this changes based on how many volume
+        # descriptors there are, e.g. Joliet).
+        pvd.path_table_location_le,
+        # The optional path table location should always be zero.
+        pvd.optional_path_table_location_le,
+        # The big endian version of the path table changes depending on how
+        # many directories there are on the ISO.
+        pvd.path_table_location_be,
+        # The optional path table location should always be zero.
+        pvd.optional_path_table_location_be,
+        # The volume set identifier is always blank here.
+        pvd.volume_set_identifier,
+        # The publisher identifier text should be blank.
+        pvd.publisher_identifier.text,
+        # The preparer identifier text should be blank.
+        pvd.preparer_identifier.text,
+        # The copyright file identifier should be blank.
+        pvd.copyright_file_identifier,
+        # The abstract file identifier should be blank.
+        pvd.abstract_file_identifier,
+        # The bibliographic file identifier should be blank.
+        pvd.bibliographic_file_identifier,
+        # The primary volume descriptor should always have a file structure
+        # version of 1.
+        pvd.file_structure_version,
+        # The length of the application use string should always be 512.
+        len(pvd.application_use),
+        # The PVD should be where we want it.
+        pvd.extent_location(),
+    )
+    expected = (
+        32,
+        32,
+        size,
+        1,
+        1,
+        2048,
+        ptbl_size,
+        ptbl_location_le,
+        0,
+        ptbl_location_be,
+        0,
+        b' '*128,
+        b' '*128,
+        b' '*128,
+        b' '*37,
+        b' '*37,
+        b' '*37,
+        1,
+        512,
+        extent,
+    )
+    assert(actual == expected)
+
+def internal_check_enhanced_vd(en_vd, size, ptbl_size, ptbl_locations):
+    (ptbl_location_le, ptbl_location_be) = ptbl_locations
 
-def internal_check_enhanced_vd(en_vd, size, ptbl_size, ptbl_location_le,
-                               ptbl_location_be):
     assert(en_vd.version == 2)
     assert(en_vd.flags == 0)
     # The length of the system identifer should always be 32.
@@ -180,8 +208,9 @@ def internal_check_eltorito(iso, boot_catalog_extent, load_rba, media_type,
     # The El Torito boot record should always be at extent 17.
     assert(eltorito.extent_location() == 17)
 
-def internal_check_jolietvd(svd, space_size, path_tbl_size, path_tbl_loc_le,
-                            path_tbl_loc_be):
+def internal_check_jolietvd(svd, space_size, path_tbl_size, path_tbl_locs):
+    (path_tbl_loc_le, path_tbl_loc_be) = path_tbl_locs
+
     # The supplementary volume descriptor should always have a version of 1.
     assert(svd.version == 1 or svd.version == 2)
     # The supplementary volume descriptor should always have flags of 0.
@@ -1004,7 +1033,7 @@ def internal_check_boot_info_table(bi_table, vd_extent, inode_extent, orig_len,
 def check_nofiles(iso, filesize):
     assert(filesize == 49152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1023,7 +1052,7 @@ def check_nofiles(iso, filesize):
 def check_onefile(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1037,7 +1066,7 @@ def check_onefile(iso, filesize):
 def check_onedir(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1052,7 +1081,7 @@ def check_onedir(iso, filesize):
 def check_twofiles(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1069,7 +1098,7 @@ def check_twofiles(iso, filesize):
 def check_twodirs(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=30, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=30, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1088,7 +1117,7 @@ def check_twodirs(iso, filesize):
 def check_onefileonedir(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1106,7 +1135,7 @@ def check_onefileonedir(iso, filesize):
 def check_onefile_onedirwithfile(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1129,7 +1158,7 @@ def check_onefile_onedirwithfile(iso, filesize):
 def check_twoextentfile(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1151,7 +1180,7 @@ def check_twoextentfile(iso, filesize):
 def check_twoleveldeepdir(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=38, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=38, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1172,7 +1201,7 @@ def check_twoleveldeepdir(iso, filesize):
 def check_tendirs(iso, filesize):
     assert(filesize == 69632)
 
-    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=132, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=132, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1194,7 +1223,7 @@ def check_tendirs(iso, filesize):
 def check_dirs_overflow_ptr_extent(iso, filesize):
     assert(filesize == 671744)
 
-    internal_check_pvd(iso.pvd, extent=16, size=328, ptbl_size=4122, ptbl_location_le=19, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=328, ptbl_size=4122, ptbl_locations=(19, 23))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1216,7 +1245,7 @@ def check_dirs_overflow_ptr_extent(iso, filesize):
 def check_dirs_just_short_ptr_extent(iso, filesize):
     assert(filesize == 659456)
 
-    internal_check_pvd(iso.pvd, extent=16, size=322, ptbl_size=4094, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=322, ptbl_size=4094, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1238,7 +1267,7 @@ def check_dirs_just_short_ptr_extent(iso, filesize):
 def check_twoleveldeepfile(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=38, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=38, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1264,9 +1293,9 @@ def check_twoleveldeepfile(iso, filesize):
 def check_joliet_nofiles(iso, filesize):
     assert(filesize == 61440)
 
-    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=30, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=30, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1285,9 +1314,9 @@ def check_joliet_nofiles(iso, filesize):
 def check_joliet_onedir(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=22, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=26, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=26, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1310,9 +1339,9 @@ def check_joliet_onedir(iso, filesize):
 def check_joliet_onefile(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1333,9 +1362,9 @@ def check_joliet_onefile(iso, filesize):
 def check_joliet_onefileonedir(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=22, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=26, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=26, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1364,7 +1393,7 @@ def check_joliet_onefileonedir(iso, filesize):
 def check_eltorito_nofiles(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1382,7 +1411,7 @@ def check_eltorito_nofiles(iso, filesize):
 def check_eltorito_twofile(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1403,7 +1432,7 @@ def check_eltorito_twofile(iso, filesize):
 def check_rr_nofiles(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1418,7 +1447,7 @@ def check_rr_nofiles(iso, filesize):
 def check_rr_onefile(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1436,7 +1465,7 @@ def check_rr_onefile(iso, filesize):
 def check_rr_twofile(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1461,7 +1490,7 @@ def check_rr_twofile(iso, filesize):
 def check_rr_onefileonedir(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1483,7 +1512,7 @@ def check_rr_onefileonedir(iso, filesize):
 def check_rr_onefileonedirwithfile(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1514,7 +1543,7 @@ def check_rr_onefileonedirwithfile(iso, filesize):
 def check_rr_symlink(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1540,7 +1569,7 @@ def check_rr_symlink(iso, filesize):
 def check_rr_symlink2(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1569,7 +1598,7 @@ def check_rr_symlink2(iso, filesize):
 def check_rr_symlink_dot(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1585,7 +1614,7 @@ def check_rr_symlink_dot(iso, filesize):
 def check_rr_symlink_dotdot(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1601,7 +1630,7 @@ def check_rr_symlink_dotdot(iso, filesize):
 def check_rr_symlink_broken(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1617,7 +1646,7 @@ def check_rr_symlink_broken(iso, filesize):
 def check_alternating_subdir(iso, filesize):
     assert(filesize == 61440)
 
-    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=30, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=30, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1656,7 +1685,7 @@ def check_alternating_subdir(iso, filesize):
 def check_rr_verylongname(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1669,9 +1698,9 @@ def check_rr_verylongname(iso, filesize):
 def check_rr_verylongname_joliet(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1691,7 +1720,7 @@ def check_rr_verylongname_joliet(iso, filesize):
 def check_rr_manylongname(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1723,7 +1752,7 @@ def check_rr_manylongname(iso, filesize):
 def check_rr_manylongname2(iso, filesize):
     assert(filesize == 71680)
 
-    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1758,7 +1787,7 @@ def check_rr_manylongname2(iso, filesize):
 def check_rr_verylongnameandsymlink(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -1771,9 +1800,9 @@ def check_rr_verylongnameandsymlink(iso, filesize):
 def check_joliet_and_rr_nofiles(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1788,9 +1817,9 @@ def check_joliet_and_rr_nofiles(iso, filesize):
 def check_joliet_and_rr_onefile(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1811,9 +1840,9 @@ def check_joliet_and_rr_onefile(iso, filesize):
 def check_joliet_and_rr_onedir(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=22, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=26, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=26, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -1840,7 +1869,7 @@ def check_joliet_and_rr_onedir(iso, filesize):
 def check_rr_and_eltorito_nofiles(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1858,7 +1887,7 @@ def check_rr_and_eltorito_nofiles(iso, filesize):
 def check_rr_and_eltorito_onefile(iso, filesize):
     assert(filesize == 59392)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1879,7 +1908,7 @@ def check_rr_and_eltorito_onefile(iso, filesize):
 def check_rr_and_eltorito_onedir(iso, filesize):
     assert(filesize == 59392)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=22, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=27, load_rba=28, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1903,9 +1932,9 @@ def check_rr_and_eltorito_onedir(iso, filesize):
 def check_joliet_and_eltorito_nofiles(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=31, load_rba=32, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1932,7 +1961,7 @@ def check_joliet_and_eltorito_nofiles(iso, filesize):
 def check_isohybrid(iso, filesize):
     assert(filesize == 1048576)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -1961,7 +1990,7 @@ def check_isohybrid(iso, filesize):
 def check_isohybrid_uefi(iso, filesize):
     assert(filesize == 1048576)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=None, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2009,7 +2038,7 @@ def check_isohybrid_uefi(iso, filesize):
 def check_isohybrid_mac_uefi(iso, filesize):
     assert(filesize == 1048576)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=None, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2061,9 +2090,9 @@ def check_isohybrid_mac_uefi(iso, filesize):
 def check_joliet_and_eltorito_onefile(iso, filesize):
     assert(filesize == 69632)
 
-    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=34, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=34, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=31, load_rba=32, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2094,9 +2123,9 @@ def check_joliet_and_eltorito_onefile(iso, filesize):
 def check_joliet_and_eltorito_onedir(iso, filesize):
     assert(filesize == 71680)
 
-    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=22, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=22, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=35, path_tbl_size=26, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=35, path_tbl_size=26, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=33, load_rba=34, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2135,9 +2164,9 @@ def check_joliet_and_eltorito_onedir(iso, filesize):
 def check_joliet_rr_and_eltorito_nofiles(iso, filesize):
     assert(filesize == 69632)
 
-    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=34, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=34, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=32, load_rba=33, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2164,9 +2193,9 @@ def check_joliet_rr_and_eltorito_nofiles(iso, filesize):
 def check_joliet_rr_and_eltorito_onefile(iso, filesize):
     assert(filesize == 71680)
 
-    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=35, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=35, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=32, load_rba=33, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2199,11 +2228,11 @@ def check_joliet_rr_and_eltorito_onefile(iso, filesize):
 def check_joliet_rr_and_eltorito_onedir(iso, filesize):
     assert(filesize == 73728)
 
-    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=22, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=22, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=34, load_rba=35, media_type=0, system_type=0, bootable=True, platform_id=0)
 
-    internal_check_jolietvd(iso.svds[0], space_size=36, path_tbl_size=26, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=36, path_tbl_size=26, path_tbl_locs=(25, 27))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -2240,7 +2269,7 @@ def check_joliet_rr_and_eltorito_onedir(iso, filesize):
 def check_rr_deep_dir(iso, filesize):
     assert(filesize == 69632)
 
-    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=122, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=122, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2270,7 +2299,7 @@ def check_rr_deep_dir(iso, filesize):
 def check_rr_deep(iso, filesize):
     assert(filesize == 71680)
 
-    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=122, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=122, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2283,7 +2312,7 @@ def check_rr_deep(iso, filesize):
 def check_rr_deep2(iso, filesize):
     assert(filesize == 73728)
 
-    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=134, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=134, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2296,9 +2325,9 @@ def check_rr_deep2(iso, filesize):
 def check_xa_nofiles(iso, filesize):
     assert(filesize == 49152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_locations=(19, 21))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2309,9 +2338,9 @@ def check_xa_nofiles(iso, filesize):
 def check_xa_onefile(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2325,9 +2354,9 @@ def check_xa_onefile(iso, filesize):
 def check_xa_onedir(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=22, ptbl_locations=(19, 21))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2344,7 +2373,7 @@ def check_xa_onedir(iso, filesize):
 def check_sevendeepdirs(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=94, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=94, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2397,13 +2426,13 @@ def check_sevendeepdirs(iso, filesize):
 def check_xa_joliet_nofiles(iso, filesize):
     assert(filesize == 61440)
 
-    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=10, ptbl_locations=(20, 22))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
-    internal_check_jolietvd(iso.svds[0], space_size=30, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=30, path_tbl_size=10, path_tbl_locs=(24, 26))
 
-    assert(iso.joliet_vd.application_use[141:149] == b'CD-XA001')
+    assert(iso.joliet_vd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2418,13 +2447,13 @@ def check_xa_joliet_nofiles(iso, filesize):
 def check_xa_joliet_onefile(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
-    assert(iso.joliet_vd.application_use[141:149] == b'CD-XA001')
+    assert(iso.joliet_vd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2445,13 +2474,13 @@ def check_xa_joliet_onefile(iso, filesize):
 def check_xa_joliet_onedir(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=22, ptbl_locations=(20, 22))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
-    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=26, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=26, path_tbl_locs=(24, 26))
 
-    assert(iso.joliet_vd.application_use[141:149] == b'CD-XA001')
+    assert(iso.joliet_vd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2478,9 +2507,9 @@ def check_xa_joliet_onedir(iso, filesize):
 def check_isolevel4_nofiles(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=25, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=25, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2491,9 +2520,9 @@ def check_isolevel4_nofiles(iso, filesize):
 def check_isolevel4_onefile(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2507,9 +2536,9 @@ def check_isolevel4_onefile(iso, filesize):
 def check_isolevel4_onedir(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_locations=(20, 22))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=22, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2526,11 +2555,11 @@ def check_isolevel4_onedir(iso, filesize):
 def check_isolevel4_eltorito(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=28, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=28, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -2546,17 +2575,17 @@ def check_isolevel4_eltorito(iso, filesize):
 def check_everything(iso, filesize):
     assert(filesize == 108544)
 
-    internal_check_pvd(iso.pvd, extent=16, size=53, ptbl_size=106, ptbl_location_le=22, ptbl_location_be=24)
+    internal_check_pvd(iso.pvd, extent=16, size=53, ptbl_size=106, ptbl_locations=(22, 24))
 
     internal_check_eltorito(iso, boot_catalog_extent=49, load_rba=50, media_type=0, system_type=0, bootable=True, platform_id=0)
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=53, ptbl_size=106, ptbl_location_le=22, ptbl_location_be=24)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=53, ptbl_size=106, ptbl_locations=(22, 24))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
-    internal_check_jolietvd(iso.svds[1], space_size=53, path_tbl_size=138, path_tbl_loc_le=26, path_tbl_loc_be=28)
+    internal_check_jolietvd(iso.svds[1], space_size=53, path_tbl_size=138, path_tbl_locs=(26, 28))
 
-    assert(iso.joliet_vd.application_use[141:149] == b'CD-XA001')
+    assert(iso.joliet_vd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=20)
 
@@ -2657,9 +2686,9 @@ def check_everything(iso, filesize):
 def check_rr_xa_nofiles(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2670,9 +2699,9 @@ def check_rr_xa_nofiles(iso, filesize):
 def check_rr_xa_onefile(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(19, 21))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2687,9 +2716,9 @@ def check_rr_xa_onefile(iso, filesize):
 def check_rr_xa_onedir(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_locations=(19, 21))
 
-    assert(iso.pvd.application_use[141:149] == b'CD-XA001')
+    assert(iso.pvd.application_use.startswith(XA_SIGNATURE, 141))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2706,9 +2735,9 @@ def check_rr_xa_onedir(iso, filesize):
 def check_rr_joliet_symlink(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2742,7 +2771,7 @@ def check_rr_joliet_symlink(iso, filesize):
 def check_rr_joliet_deep(iso, filesize):
     assert(filesize == 98304)
 
-    internal_check_pvd(iso.pvd, extent=16, size=48, ptbl_size=122, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=48, ptbl_size=122, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2791,7 +2820,7 @@ def check_rr_joliet_deep(iso, filesize):
 def check_eltorito_multi_boot(iso, filesize):
     assert(filesize == 59392)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2827,7 +2856,7 @@ def check_eltorito_multi_boot(iso, filesize):
 def check_eltorito_multi_boot_hard_link(iso, filesize):
     assert(filesize == 59392)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2866,7 +2895,7 @@ def check_eltorito_multi_boot_hard_link(iso, filesize):
 def check_eltorito_boot_info_table(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2887,7 +2916,7 @@ def check_eltorito_boot_info_table(iso, filesize):
 def check_eltorito_boot_info_table_large(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -2908,7 +2937,7 @@ def check_eltorito_boot_info_table_large(iso, filesize):
 def check_hard_link(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -2931,9 +2960,9 @@ def check_hard_link(iso, filesize):
 def check_same_dirname_different_parent(iso, filesize):
     assert(filesize == 79872)
 
-    internal_check_pvd(iso.pvd, extent=16, size=39, ptbl_size=58, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=39, ptbl_size=58, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=39, path_tbl_size=74, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=39, path_tbl_size=74, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -2996,11 +3025,11 @@ def check_same_dirname_different_parent(iso, filesize):
 def check_joliet_isolevel4(iso, filesize):
     assert(filesize == 69632)
 
-    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=22, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=22, ptbl_locations=(21, 23))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=34, ptbl_size=22, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=34, ptbl_size=22, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.joliet_vd, space_size=34, path_tbl_size=26, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.joliet_vd, space_size=34, path_tbl_size=26, path_tbl_locs=(25, 27))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -3029,7 +3058,7 @@ def check_joliet_isolevel4(iso, filesize):
 def check_eltorito_nofiles_hide(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3045,9 +3074,9 @@ def check_eltorito_nofiles_hide(iso, filesize):
 def check_joliet_and_eltorito_nofiles_hide(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=31, load_rba=32, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3070,9 +3099,9 @@ def check_joliet_and_eltorito_nofiles_hide(iso, filesize):
 def check_joliet_and_eltorito_nofiles_hide_only(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=31, load_rba=32, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3097,9 +3126,9 @@ def check_joliet_and_eltorito_nofiles_hide_only(iso, filesize):
 def check_joliet_and_eltorito_nofiles_hide_iso_only(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=31, load_rba=32, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3124,7 +3153,7 @@ def check_joliet_and_eltorito_nofiles_hide_iso_only(iso, filesize):
 def check_hard_link_reshuffle(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3141,7 +3170,7 @@ def check_hard_link_reshuffle(iso, filesize):
 def check_rr_deeper_dir(iso, filesize):
     assert(filesize == 86016)
 
-    internal_check_pvd(iso.pvd, extent=16, size=42, ptbl_size=202, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=42, ptbl_size=202, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3186,7 +3215,7 @@ def check_rr_deeper_dir(iso, filesize):
 def check_eltorito_boot_info_table_large_odd(iso, filesize):
     assert(filesize == 57344)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3208,9 +3237,9 @@ def check_eltorito_boot_info_table_large_odd(iso, filesize):
 def check_joliet_large_directory(iso, filesize):
     assert(filesize == 264192)
 
-    internal_check_pvd(iso.pvd, extent=16, size=129, ptbl_size=678, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=129, ptbl_size=678, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=129, path_tbl_size=874, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=129, path_tbl_size=874, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3219,7 +3248,7 @@ def check_joliet_large_directory(iso, filesize):
 def check_zero_byte_file(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3236,7 +3265,7 @@ def check_zero_byte_file(iso, filesize):
 def check_eltorito_hide_boot(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3266,7 +3295,7 @@ def check_eltorito_hide_boot(iso, filesize):
 def check_modify_in_place_spillover(iso, filesize):
     assert(filesize == 151552)
 
-    internal_check_pvd(iso.pvd, extent=16, size=74, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=74, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3281,9 +3310,9 @@ def check_modify_in_place_spillover(iso, filesize):
 def check_duplicate_pvd(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_pvd(iso.pvds[1], extent=17, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvds[1], extent=17, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3294,7 +3323,7 @@ def check_duplicate_pvd(iso, filesize):
 def check_eltorito_multi_multi_boot(iso, filesize):
     assert(filesize == 61440)
 
-    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=27, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3344,7 +3373,7 @@ def check_eltorito_multi_multi_boot(iso, filesize):
 def check_hidden_file(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3358,7 +3387,7 @@ def check_hidden_file(iso, filesize):
 def check_hidden_dir(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3373,7 +3402,7 @@ def check_hidden_dir(iso, filesize):
 def check_eltorito_hd_emul(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=4, system_type=2, bootable=True, platform_id=0)
 
@@ -3391,7 +3420,7 @@ def check_eltorito_hd_emul(iso, filesize):
 def check_eltorito_hd_emul_bad_sec(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=4, system_type=2, bootable=True, platform_id=0)
 
@@ -3409,7 +3438,7 @@ def check_eltorito_hd_emul_bad_sec(iso, filesize):
 def check_eltorito_hd_emul_invalid_geometry(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=4, system_type=2, bootable=True, platform_id=0)
 
@@ -3427,7 +3456,7 @@ def check_eltorito_hd_emul_invalid_geometry(iso, filesize):
 def check_eltorito_hd_emul_not_bootable(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=4, system_type=2, bootable=False, platform_id=0)
 
@@ -3445,7 +3474,7 @@ def check_eltorito_hd_emul_not_bootable(iso, filesize):
 def check_eltorito_floppy12(iso, filesize):
     assert(filesize == 1282048)
 
-    internal_check_pvd(iso.pvd, extent=16, size=626, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=626, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=1, system_type=0, bootable=True, platform_id=0)
 
@@ -3463,7 +3492,7 @@ def check_eltorito_floppy12(iso, filesize):
 def check_eltorito_floppy144(iso, filesize):
     assert(filesize == 1527808)
 
-    internal_check_pvd(iso.pvd, extent=16, size=746, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=746, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=2, system_type=0, bootable=True, platform_id=0)
 
@@ -3481,7 +3510,7 @@ def check_eltorito_floppy144(iso, filesize):
 def check_eltorito_floppy288(iso, filesize):
     assert(filesize == 3002368)
 
-    internal_check_pvd(iso.pvd, extent=16, size=1466, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=1466, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=3, system_type=0, bootable=True, platform_id=0)
 
@@ -3499,7 +3528,7 @@ def check_eltorito_floppy288(iso, filesize):
 def check_eltorito_multi_hidden(iso, filesize):
     assert(filesize == 59392)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=26, load_rba=28, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3532,7 +3561,7 @@ def check_eltorito_multi_hidden(iso, filesize):
 def check_onefile_with_semicolon(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3546,7 +3575,7 @@ def check_onefile_with_semicolon(iso, filesize):
 def check_bad_eltorito_ident(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     # Because this is a bad eltorito ident, we expect the len(brs) to be > 0,
     # but no eltorito catalog available
@@ -3569,7 +3598,7 @@ def check_rr_two_dirs_same_level(iso, filesize):
     # genisoimage seems to pad the second entry in the PTR with three zeros (000), the
     # third one with 001, etc.  pycdlib does not do this, so the sizes do not match.
     # Hence, for now, we disable this check.
-    #internal_check_pvd(iso.pvd, extent=16, size=38, ptbl_size=128, ptbl_location_le=19, ptbl_location_be=21)
+    #internal_check_pvd(iso.pvd, extent=16, size=38, ptbl_size=128, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3635,7 +3664,7 @@ def check_rr_two_dirs_same_level(iso, filesize):
 def check_eltorito_rr_verylongname(iso, filesize):
     assert(filesize == 59392)
 
-    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=29, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=27, load_rba=28, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3653,7 +3682,7 @@ def check_eltorito_rr_verylongname(iso, filesize):
 def check_isohybrid_file_before(iso, filesize):
     assert(filesize == 1048576)
 
-    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=28, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -3678,11 +3707,11 @@ def check_isohybrid_file_before(iso, filesize):
 def check_eltorito_rr_joliet_verylongname(iso, filesize):
     assert(filesize == 71680)
 
-    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=35, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_eltorito(iso, boot_catalog_extent=33, load_rba=34, media_type=0, system_type=0, bootable=True, platform_id=0)
 
-    internal_check_jolietvd(iso.svds[0], space_size=35, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=35, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -3708,9 +3737,9 @@ def check_eltorito_rr_joliet_verylongname(iso, filesize):
 def check_joliet_dirs_overflow_ptr_extent(iso, filesize):
     assert(filesize == 970752)
 
-    internal_check_pvd(iso.pvd, extent=16, size=474, ptbl_size=3016, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=474, ptbl_size=3016, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=474, path_tbl_size=4114, path_tbl_loc_le=24, path_tbl_loc_be=28)
+    internal_check_jolietvd(iso.svds[0], space_size=474, path_tbl_size=4114, path_tbl_locs=(24, 28))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3732,9 +3761,9 @@ def check_joliet_dirs_overflow_ptr_extent(iso, filesize):
 def check_joliet_dirs_just_short_ptr_extent(iso, filesize):
     assert(filesize == 958464)
 
-    internal_check_pvd(iso.pvd, extent=16, size=468, ptbl_size=3002, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=468, ptbl_size=3002, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=468, path_tbl_size=4094, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=468, path_tbl_size=4094, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3756,9 +3785,9 @@ def check_joliet_dirs_just_short_ptr_extent(iso, filesize):
 def check_joliet_dirs_add_ptr_extent(iso, filesize):
     assert(filesize == 1308672)
 
-    internal_check_pvd(iso.pvd, extent=16, size=639, ptbl_size=4122, ptbl_location_le=20, ptbl_location_be=24)
+    internal_check_pvd(iso.pvd, extent=16, size=639, ptbl_size=4122, ptbl_locations=(20, 24))
 
-    internal_check_jolietvd(iso.svds[0], space_size=639, path_tbl_size=5694, path_tbl_loc_le=28, path_tbl_loc_be=32)
+    internal_check_jolietvd(iso.svds[0], space_size=639, path_tbl_size=5694, path_tbl_locs=(28, 32))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3780,9 +3809,9 @@ def check_joliet_dirs_add_ptr_extent(iso, filesize):
 def check_joliet_dirs_rm_ptr_extent(iso, filesize):
     assert(filesize == 1292288)
 
-    internal_check_pvd(iso.pvd, extent=16, size=631, ptbl_size=4094, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=631, ptbl_size=4094, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=631, path_tbl_size=5654, path_tbl_loc_le=24, path_tbl_loc_be=28)
+    internal_check_jolietvd(iso.svds[0], space_size=631, path_tbl_size=5654, path_tbl_locs=(24, 28))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3804,7 +3833,7 @@ def check_joliet_dirs_rm_ptr_extent(iso, filesize):
 def check_long_directory_name(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=28, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=28, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3819,7 +3848,7 @@ def check_long_directory_name(iso, filesize):
 def check_long_file_name(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3833,7 +3862,7 @@ def check_long_file_name(iso, filesize):
 def check_overflow_root_dir_record(iso, filesize):
     assert(filesize == 94208)
 
-    internal_check_pvd(iso.pvd, extent=16, size=46, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=46, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3846,7 +3875,7 @@ def check_overflow_root_dir_record(iso, filesize):
 def check_overflow_correct_extents(iso, filesize):
     assert(filesize == 102400)
 
-    internal_check_pvd(iso.pvd, extent=16, size=50, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=50, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3859,7 +3888,7 @@ def check_overflow_correct_extents(iso, filesize):
 def check_duplicate_deep_dir(iso, filesize):
     assert(filesize == 135168)
 
-    internal_check_pvd(iso.pvd, extent=16, size=66, ptbl_size=216, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=66, ptbl_size=216, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3909,9 +3938,9 @@ def check_duplicate_deep_dir(iso, filesize):
 def check_onefile_joliet_no_file(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -3929,11 +3958,11 @@ def check_onefile_joliet_no_file(iso, filesize):
 def check_joliet_isolevel4_nofiles(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.joliet_vd, space_size=31, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.joliet_vd, space_size=31, path_tbl_size=10, path_tbl_locs=(25, 27))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=31, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=31, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -3948,7 +3977,7 @@ def check_joliet_isolevel4_nofiles(iso, filesize):
 def check_rr_absolute_symlink(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3964,7 +3993,7 @@ def check_rr_absolute_symlink(iso, filesize):
 def check_deep_rr_symlink(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=94, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=94, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -3988,7 +4017,7 @@ def check_deep_rr_symlink(iso, filesize):
 def check_rr_deep_weird_layout(iso, filesize):
     assert(filesize == 73728)
 
-    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=146, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=146, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4031,7 +4060,7 @@ def check_rr_deep_weird_layout(iso, filesize):
 def check_rr_long_dir_name(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=26, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=26, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4046,7 +4075,7 @@ def check_rr_long_dir_name(iso, filesize):
 def check_rr_out_of_order_ce(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=26, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=26, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4066,7 +4095,7 @@ def check_rr_out_of_order_ce(iso, filesize):
 def check_rr_ce_removal(iso, filesize):
     assert(filesize == 61440)
 
-    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=74, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=30, ptbl_size=74, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4079,7 +4108,7 @@ def check_rr_ce_removal(iso, filesize):
 def check_rr_relocated_hidden(iso, filesize):
     assert(filesize == 73728)
 
-    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=134, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=36, ptbl_size=134, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4113,11 +4142,11 @@ def check_rr_relocated_hidden(iso, filesize):
 def check_duplicate_pvd_joliet(iso, filesize):
     assert(filesize == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_pvd(iso.pvds[1], extent=17, size=32, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvds[1], extent=17, size=32, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -4137,7 +4166,7 @@ def check_duplicate_pvd_joliet(iso, filesize):
 def check_onefile_toolong(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4150,7 +4179,7 @@ def check_onefile_toolong(iso, filesize):
 def check_pvd_zero_datetime(iso, filesize):
     assert(filesize == 49152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4170,9 +4199,9 @@ def check_pvd_zero_datetime(iso, filesize):
 def check_joliet_different_names(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -4193,9 +4222,9 @@ def check_joliet_different_names(iso, filesize):
 def check_hidden_joliet_file(iso, size):
     assert(size == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -4206,9 +4235,9 @@ def check_hidden_joliet_file(iso, size):
 def check_hidden_joliet_dir(iso, size):
     assert(size == 65536)
 
-    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=22, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=32, ptbl_size=22, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=26, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=32, path_tbl_size=26, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -4221,7 +4250,7 @@ def check_hidden_joliet_dir(iso, size):
 def check_rr_onefileonedir_hidden(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=22, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4244,7 +4273,7 @@ def check_rr_onefileonedir_hidden(iso, filesize):
 def check_rr_onefile_onetwelve(iso, size):
     assert(size == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4259,11 +4288,11 @@ def check_rr_onefile_onetwelve(iso, size):
 def check_joliet_ident_encoding(iso, filesize):
     assert(filesize == 69632)
 
-    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=34, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=34, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=34, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.joliet_vd, space_size=34, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.joliet_vd, space_size=34, path_tbl_size=10, path_tbl_locs=(25, 27))
     assert(iso.joliet_vd.volume_identifier == 'cidata'.ljust(16, ' ').encode('utf-16_be'))
     assert(iso.joliet_vd.system_identifier == 'LINUX'.ljust(16, ' ').encode('utf-16_be'))
 
@@ -4286,11 +4315,11 @@ def check_joliet_ident_encoding(iso, filesize):
 def check_duplicate_pvd_isolevel4(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_pvd(iso.pvds[1], extent=17, size=27, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvds[1], extent=17, size=27, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=27, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=27, ptbl_size=10, ptbl_locations=(21, 23))
 
     internal_check_terminator(iso.vdsts, extent=19)
 
@@ -4301,9 +4330,9 @@ def check_duplicate_pvd_isolevel4(iso, filesize):
 def check_joliet_hidden_iso_file(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -4321,7 +4350,7 @@ def check_joliet_hidden_iso_file(iso, filesize):
 def check_eltorito_bootlink(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -4353,7 +4382,7 @@ def check_eltorito_bootlink(iso, filesize):
 def check_udf_nofiles(iso, filesize):
     assert(filesize == 546816)
 
-    internal_check_pvd(iso.pvd, extent=16, size=267, ptbl_size=10, ptbl_location_le=261, ptbl_location_be=263)
+    internal_check_pvd(iso.pvd, extent=16, size=267, ptbl_size=10, ptbl_locations=(261, 263))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4370,7 +4399,7 @@ def check_udf_nofiles(iso, filesize):
 def check_udf_onedir(iso, filesize):
     assert(filesize == 552960)
 
-    internal_check_pvd(iso.pvd, extent=16, size=270, ptbl_size=22, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=270, ptbl_size=22, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4396,7 +4425,7 @@ def check_udf_onedir(iso, filesize):
 def check_udf_twodirs(iso, filesize):
     assert(filesize == 559104)
 
-    internal_check_pvd(iso.pvd, extent=16, size=273, ptbl_size=34, ptbl_location_le=265, ptbl_location_be=267)
+    internal_check_pvd(iso.pvd, extent=16, size=273, ptbl_size=34, ptbl_locations=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4426,7 +4455,7 @@ def check_udf_twodirs(iso, filesize):
 def check_udf_subdir(iso, filesize):
     assert(filesize == 559104)
 
-    internal_check_pvd(iso.pvd, extent=16, size=273, ptbl_size=38, ptbl_location_le=265, ptbl_location_be=267)
+    internal_check_pvd(iso.pvd, extent=16, size=273, ptbl_size=38, ptbl_locations=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4456,7 +4485,7 @@ def check_udf_subdir(iso, filesize):
 def check_udf_subdir_odd(iso, filesize):
     assert(filesize == 559104)
 
-    internal_check_pvd(iso.pvd, extent=16, size=273, ptbl_size=36, ptbl_location_le=265, ptbl_location_be=267)
+    internal_check_pvd(iso.pvd, extent=16, size=273, ptbl_size=36, ptbl_locations=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4486,7 +4515,7 @@ def check_udf_subdir_odd(iso, filesize):
 def check_udf_onefile(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4514,7 +4543,7 @@ def check_udf_onefile(iso, filesize):
 def check_udf_onefileonedir(iso, filesize):
     assert(filesize == 557056)
 
-    internal_check_pvd(iso.pvd, extent=16, size=272, ptbl_size=22, ptbl_location_le=264, ptbl_location_be=266)
+    internal_check_pvd(iso.pvd, extent=16, size=272, ptbl_size=22, ptbl_locations=(264, 266))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4552,7 +4581,7 @@ def check_udf_onefileonedir(iso, filesize):
 def check_udf_dir_spillover(iso, filesize):
     assert(filesize == 677888)
 
-    internal_check_pvd(iso.pvd, extent=16, size=331, ptbl_size=346, ptbl_location_le=304, ptbl_location_be=306)
+    internal_check_pvd(iso.pvd, extent=16, size=331, ptbl_size=346, ptbl_locations=(304, 306))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4598,7 +4627,7 @@ def check_udf_dir_spillover(iso, filesize):
 def check_udf_dir_oneshort(iso, filesize):
     assert(filesize == 671744)
 
-    internal_check_pvd(iso.pvd, extent=16, size=328, ptbl_size=330, ptbl_location_le=302, ptbl_location_be=304)
+    internal_check_pvd(iso.pvd, extent=16, size=328, ptbl_size=330, ptbl_locations=(302, 304))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4644,7 +4673,7 @@ def check_udf_dir_oneshort(iso, filesize):
 def check_udf_iso_hidden(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4669,7 +4698,7 @@ def check_udf_iso_hidden(iso, filesize):
 def check_udf_hidden(iso, filesize):
     assert(filesize == 548864)
 
-    internal_check_pvd(iso.pvd, extent=16, size=268, ptbl_size=10, ptbl_location_le=261, ptbl_location_be=263)
+    internal_check_pvd(iso.pvd, extent=16, size=268, ptbl_size=10, ptbl_locations=(261, 263))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4689,7 +4718,7 @@ def check_udf_hidden(iso, filesize):
 def check_very_largefile(iso, filesize):
     assert(filesize == 5368758272)
 
-    internal_check_pvd(iso.pvd, extent=16, size=2621464, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=2621464, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4704,7 +4733,7 @@ def check_very_largefile(iso, filesize):
 def check_udf_very_large(iso, filesize):
     assert(filesize == 1074290688)
 
-    internal_check_pvd(iso.pvd, extent=16, size=524556, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=524556, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4729,9 +4758,9 @@ def check_udf_very_large(iso, filesize):
 def check_joliet_udf_nofiles(iso, filesize):
     assert(filesize == 557056)
 
-    internal_check_pvd(iso.pvd, extent=16, size=272, ptbl_size=10, ptbl_location_le=261, ptbl_location_be=263)
+    internal_check_pvd(iso.pvd, extent=16, size=272, ptbl_size=10, ptbl_locations=(261, 263))
 
-    internal_check_jolietvd(iso.svds[0], space_size=272, path_tbl_size=10, path_tbl_loc_le=265, path_tbl_loc_be=267)
+    internal_check_jolietvd(iso.svds[0], space_size=272, path_tbl_size=10, path_tbl_locs=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -4756,7 +4785,7 @@ def check_joliet_udf_nofiles(iso, filesize):
 def check_udf_dir_exactly2048(iso, filesize):
     assert(filesize == 589824)
 
-    internal_check_pvd(iso.pvd, extent=16, size=288, ptbl_size=122, ptbl_location_le=275, ptbl_location_be=277)
+    internal_check_pvd(iso.pvd, extent=16, size=288, ptbl_size=122, ptbl_locations=(275, 277))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4811,7 +4840,7 @@ def check_udf_dir_exactly2048(iso, filesize):
 def check_udf_symlink(iso, filesize):
     assert(filesize == 555008)
 
-    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4838,7 +4867,7 @@ def check_udf_symlink(iso, filesize):
 def check_udf_symlink_in_dir(iso, filesize):
     assert(filesize == 561152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=22, ptbl_location_le=265, ptbl_location_be=267)
+    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=22, ptbl_locations=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4868,7 +4897,7 @@ def check_udf_symlink_in_dir(iso, filesize):
 def check_udf_symlink_abs_path(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4893,7 +4922,7 @@ def check_udf_symlink_abs_path(iso, filesize):
 def check_udf_rr_symlink(iso, filesize):
     assert(filesize == 557056)
 
-    internal_check_pvd(iso.pvd, extent=16, size=272, ptbl_size=10, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=272, ptbl_size=10, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4938,7 +4967,7 @@ def check_udf_rr_symlink(iso, filesize):
 def check_udf_overflow_dir_extent(iso, filesize):
     assert(filesize == 831488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=406, ptbl_size=636, ptbl_location_le=354, ptbl_location_be=356)
+    internal_check_pvd(iso.pvd, extent=16, size=406, ptbl_size=636, ptbl_locations=(354, 356))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4970,7 +4999,7 @@ def check_udf_overflow_dir_extent(iso, filesize):
 def check_udf_hardlink(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5005,7 +5034,7 @@ def check_udf_hardlink(iso, filesize):
 def check_multi_hard_link(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5025,9 +5054,9 @@ def check_multi_hard_link(iso, filesize):
 def check_joliet_with_version(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5048,9 +5077,9 @@ def check_joliet_with_version(iso, filesize):
 def check_udf_joliet_onefile(iso, filesize):
     assert(filesize == 561152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=10, ptbl_locations=(262, 264))
 
-    internal_check_jolietvd(iso.svds[0], space_size=274, path_tbl_size=10, path_tbl_loc_le=266, path_tbl_loc_be=268)
+    internal_check_jolietvd(iso.svds[0], space_size=274, path_tbl_size=10, path_tbl_locs=(266, 268))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5085,9 +5114,9 @@ def check_udf_joliet_onefile(iso, filesize):
 def check_joliet_and_eltorito_joliet_only(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_location_le=21, ptbl_location_be=23)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=10, ptbl_locations=(21, 23))
 
-    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_loc_le=25, path_tbl_loc_be=27)
+    internal_check_jolietvd(iso.svds[0], space_size=33, path_tbl_size=10, path_tbl_locs=(25, 27))
 
     internal_check_eltorito(iso, boot_catalog_extent=31, load_rba=32, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -5112,7 +5141,7 @@ def check_joliet_and_eltorito_joliet_only(iso, filesize):
 def check_udf_and_eltorito_udf_only(iso, filesize):
     assert(filesize == 555008)
 
-    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5146,7 +5175,7 @@ def check_udf_and_eltorito_udf_only(iso, filesize):
 def check_udf_onefile_multi_links(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5182,7 +5211,7 @@ def check_udf_onefile_multi_links(iso, filesize):
 def check_udf_dotdot_symlink(iso, filesize):
     assert(filesize == 561152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=22, ptbl_location_le=265, ptbl_location_be=267)
+    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=22, ptbl_locations=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5229,7 +5258,7 @@ def check_udf_dotdot_symlink(iso, filesize):
 def check_udf_dot_symlink(iso, filesize):
     assert(filesize == 555008)
 
-    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5265,7 +5294,7 @@ def check_udf_dot_symlink(iso, filesize):
 def check_udf_zero_byte_file(iso, filesize):
     assert(filesize == 552960)
 
-    internal_check_pvd(iso.pvd, extent=16, size=270, ptbl_size=10, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=270, ptbl_size=10, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5304,7 +5333,7 @@ def check_udf_zero_byte_file(iso, filesize):
 def check_udf_onefile_onedirwithfile(iso, filesize):
     assert(filesize == 561152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=22, ptbl_location_le=265, ptbl_location_be=267)
+    internal_check_pvd(iso.pvd, extent=16, size=274, ptbl_size=22, ptbl_locations=(265, 267))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5355,7 +5384,7 @@ def check_udf_onefile_onedirwithfile(iso, filesize):
 def check_zero_byte_hard_link(iso, filesize):
     assert(filesize == 49152)
 
-    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=24, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5372,7 +5401,7 @@ def check_zero_byte_hard_link(iso, filesize):
 def check_udf_zero_byte_hard_link(iso, filesize):
     assert(filesize == 548864)
 
-    internal_check_pvd(iso.pvd, extent=16, size=268, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=268, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5400,7 +5429,7 @@ def check_udf_zero_byte_hard_link(iso, filesize):
 def check_unicode_name(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5414,9 +5443,9 @@ def check_unicode_name(iso, filesize):
 def check_unicode_name_isolevel4(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5430,9 +5459,9 @@ def check_unicode_name_isolevel4(iso, filesize):
 def check_unicode_name_joliet(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5451,7 +5480,7 @@ def check_unicode_name_joliet(iso, filesize):
 def check_unicode_name_udf(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5479,7 +5508,7 @@ def check_unicode_name_udf(iso, filesize):
 def check_unicode_name_two_byte(iso, filesize):
     assert(filesize == 51200)
 
-    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=21)
+    internal_check_pvd(iso.pvd, extent=16, size=25, ptbl_size=10, ptbl_locations=(19, 21))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5493,9 +5522,9 @@ def check_unicode_name_two_byte(iso, filesize):
 def check_unicode_name_two_byte_isolevel4(iso, filesize):
     assert(filesize == 53248)
 
-    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_enhanced_vd(iso.enhanced_vd, size=26, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5509,9 +5538,9 @@ def check_unicode_name_two_byte_isolevel4(iso, filesize):
 def check_unicode_name_two_byte_joliet(iso, filesize):
     assert(filesize == 63488)
 
-    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=31, ptbl_size=10, ptbl_locations=(20, 22))
 
-    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_loc_le=24, path_tbl_loc_be=26)
+    internal_check_jolietvd(iso.svds[0], space_size=31, path_tbl_size=10, path_tbl_locs=(24, 26))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5530,7 +5559,7 @@ def check_unicode_name_two_byte_joliet(iso, filesize):
 def check_unicode_name_two_byte_udf(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5556,7 +5585,7 @@ def check_unicode_name_two_byte_udf(iso, filesize):
 def check_udf_unicode_symlink(iso, filesize):
     assert(filesize == 555008)
 
-    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_location_le=263, ptbl_location_be=265)
+    internal_check_pvd(iso.pvd, extent=16, size=271, ptbl_size=10, ptbl_locations=(263, 265))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5591,7 +5620,7 @@ def check_udf_unicode_symlink(iso, filesize):
 def check_udf_zeroed_file_entry(iso, filesize):
     assert(filesize == 550912)
 
-    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_location_le=262, ptbl_location_be=264)
+    internal_check_pvd(iso.pvd, extent=16, size=269, ptbl_size=10, ptbl_locations=(262, 264))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5628,7 +5657,7 @@ def check_udf_unicode(iso, filesize):
     assert(filesize == 571392)
 
     # Check ISO headers
-    internal_check_pvd(iso.pvd, extent=16, size=279, ptbl_size=48, ptbl_location_le=270, ptbl_location_be=272)
+    internal_check_pvd(iso.pvd, extent=16, size=279, ptbl_size=48, ptbl_locations=(270, 272))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -5703,7 +5732,7 @@ def check_udf_unicode(iso, filesize):
 def check_eltorito_get_bootcat(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0)
 
@@ -5723,7 +5752,7 @@ def check_eltorito_get_bootcat(iso, filesize):
 def check_eltorito_uefi(iso, filesize):
     assert(filesize == 55296)
 
-    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=27, ptbl_size=10, ptbl_locations=(20, 22))
 
     internal_check_eltorito(iso, boot_catalog_extent=25, load_rba=26, media_type=0, system_type=0, bootable=True, platform_id=0xef)
 
@@ -5741,7 +5770,7 @@ def check_eltorito_uefi(iso, filesize):
 def check_isolevel4_deep_directory(iso, filesize):
     assert(filesize == 67584)
 
-    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=94, ptbl_location_le=20, ptbl_location_be=22)
+    internal_check_pvd(iso.pvd, extent=16, size=33, ptbl_size=94, ptbl_locations=(20, 22))
 
     internal_check_terminator(iso.vdsts, extent=18)
 
@@ -5775,7 +5804,7 @@ def check_isolevel4_deep_directory(iso, filesize):
 def check_onefile_one_extent_path_tables(iso, filesize):
     assert(filesize == 47104)
 
-    internal_check_pvd(iso.pvd, extent=16, size=23, ptbl_size=10, ptbl_location_le=19, ptbl_location_be=20)
+    internal_check_pvd(iso.pvd, extent=16, size=23, ptbl_size=10, ptbl_locations=(19, 20))
 
     internal_check_terminator(iso.vdsts, extent=17)
 
@@ -4,13 +4,7 @@ from __future__ import absolute_import
 
 import pytest
 import os
-import sys
-try:
-    from cStringIO import StringIO as BytesIO
-except ImportError:
-    from io import BytesIO
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from io import BytesIO
 
 import pycdlib
 
@@ -3,11 +3,8 @@
 import pytest
 import subprocess
 import os
-import sys
 import struct
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 import pycdlib
 
 from test_common import *